@@ -3,40 +3,35 @@
 
 """Simple and easy-to-use text-based program for launching mpv."""
 
-from signal import signal, SIGCHLD, SIG_IGN, SIGTERM
-from string import digits, punctuation, whitespace
+from string import digits, punctuation
 from subprocess import Popen, DEVNULL
-from collections.abc import Sequence
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
-from pathlib import Path
+from enum import IntFlag
+from itertools import islice
 from shlex import split
+from unicodedata import east_asian_width
 import curses
 import sys
 import os
 
-from natsort import natsorted
-
-signal(SIGCHLD, SIG_IGN)  # Prevents the formation of zombie processes.
+from natsort import natsort_keygen
 
 # Essential constants:
-AUDIO_EXTS: tuple[str, ...] = ("aac", "flac", "m4a", "mp3", "ogg", "wav", "wma")
-VIDEO_EXTS: tuple[str, ...] = ("avi", "iso", "mkv", "mov", "mp4", "webm", "wmv")
-OTHER_EXTS: tuple[str, ...] = ("cue", "m3u", "m3u8")
+AUDIO_EXTS: frozenset[str] = frozenset(("aac", "flac", "m4a", "mp3", "ogg", "wav", "wma"))
+VIDEO_EXTS: frozenset[str] = frozenset(("avi", "iso", "mkv", "mov", "mp4", "webm", "wmv"))
+OTHER_EXTS: frozenset[str] = frozenset(("cue", "m3u", "m3u8"))
 
-SUB_EXTS: tuple[str, ...] = ("ass", "idx", "lrc", "srt", "sub", "vtt")
+SUB_EXTS: frozenset[str] = frozenset(("ass", "idx", "lrc", "srt", "sub", "vtt"))
 
-MPV_EXTENSIONS: tuple[str, ...] = (
-    *AUDIO_EXTS,
-    *VIDEO_EXTS,
-    *OTHER_EXTS,
-    *SUB_EXTS,
-)
+MPV_EXTENSIONS: frozenset[str] = AUDIO_EXTS | VIDEO_EXTS | OTHER_EXTS | SUB_EXTS
 
 ENV_MPVL_MPV_CMD: str = os.getenv("MPVL_MPV_CMD", "mpv --force-window")
+MPV_CMD_ARGV: tuple[str, ...] = tuple(split(ENV_MPVL_MPV_CMD))  # Split only once.
 MPV_SUB_FILE_OPTION: str = "--sub-file="
 MPV_PAUSE_FLAG: str = "--pause"
-MPV_DVD_ISO_OPTION: str = "dvd:// --dvd-device="
-MPV_BD_ISO_OPTION: str = "bd:// --bluray-device="
+MPV_DVD_ISO_OPTION: tuple[str, str] = ("dvd://", "--dvd-device=")
+MPV_BD_ISO_OPTION: tuple[str, str] = ("bd://", "--bluray-device=")
 
 # ISO approx.:
 # SMALLER -> DVD
@@ -44,78 +39,71 @@ MPV_BD_ISO_OPTION: str = "bd:// --bluray-device="
 DVD9_SIZE: int = 8500000000
 
 IGNORED_NAMES: tuple[str, ...] = ("lost+found", ".git")  # Case-insensitive!
+IGNORED_NAMES_CF: frozenset[str] = frozenset(n.casefold() for n in IGNORED_NAMES)  # (for the lookups)
 
 SPACE_CHAR: str = chr(32)  # for a bit more readable code...
 
+# Characters (besides letters) that can be typed into the name filter:
+FILTER_CHARS: frozenset[str] = frozenset((SPACE_CHAR, *digits, *punctuation))
 
-def exec_nonblocking(cmd: str) -> int:
-    """Creates a child process that does not block the parent process."""
-    p = Popen(split(cmd), stdin=DEVNULL, stdout=DEVNULL, stderr=DEVNULL, start_new_session=True)
-    return p.pid
+# Natural sort key of a name. (Created only once; the keys themselves are memoized per directory by Navi.)
+NATSORT_KEY: Callable[[str], tuple] = natsort_keygen()
 
 
-def mpv_open(path: str, sub_path: str = "", paused: bool = False) -> int:
-    cmd: list[str] = [ENV_MPVL_MPV_CMD]
-    if paused:
-        cmd.append(MPV_PAUSE_FLAG)
-    if sub_path:
-        cmd.append("".join((MPV_SUB_FILE_OPTION, '"', sub_path, '"')))
-    cmd.append("".join(('"', path, '"')))
-    return exec_nonblocking(SPACE_CHAR.join(cmd))
+def exec_nonblocking(argv: list[str]) -> Popen:
+    """Creates a child process that does not block the parent process.
+    (The arguments are passed as they are, so paths need no quoting.)
+    The returned object has to be kept until the process is reaped by its poll():
+    if it is dropped earlier, subprocess reaps the process on its own, behind the caller's back."""
+    return Popen(argv, stdin=DEVNULL, stdout=DEVNULL, stderr=DEVNULL, start_new_session=True)
 
 
-def mpv_open_iso(path: str, size: int = 0, paused: bool = False) -> int:
-    cmd: list[str] = [ENV_MPVL_MPV_CMD]
+def mpv_open(path: str, sub_path: str = "", paused: bool = False) -> Popen:
+    argv: list[str] = list(MPV_CMD_ARGV)
     if paused:
-        cmd.append(MPV_PAUSE_FLAG)
-    if size < DVD9_SIZE:
-        cmd.append("".join((MPV_DVD_ISO_OPTION, '"', path, '"')))
-    else:
-        cmd.append("".join((MPV_BD_ISO_OPTION, '"', path, '"')))
-    return exec_nonblocking(SPACE_CHAR.join(cmd))
+        argv.append(MPV_PAUSE_FLAG)
+    if sub_path:
+        argv.append("".join((MPV_SUB_FILE_OPTION, sub_path)))
+    argv.append(path)
+    return exec_nonblocking(argv)
 
 
-def process_exists(pid: int) -> bool:
-    return os.path.isdir(f"/proc/{pid}")
+def mpv_open_iso(path: str, size: int = 0, paused: bool = False) -> Popen:
+    argv: list[str] = list(MPV_CMD_ARGV)
+    if paused:
+        argv.append(MPV_PAUSE_FLAG)
+    url, device_option = MPV_DVD_ISO_OPTION if size < DVD9_SIZE else MPV_BD_ISO_OPTION
+    argv.extend((url, "".join((device_option, path))))
+    return exec_nonblocking(argv)
 
 
-def fixed_len_slice(data: Sequence, max_len: int, offset: int = 0) -> Sequence:
-    """A function that returns a slice of a given size from an indexable data type,
-    considering the specified offset."""
-    data_len: int = len(data)
-    if data_len <= max_len:
-        return data
-    offset = max(0, min(offset, data_len - max_len))
-    return data[offset : max_len + offset]
+def is_filter_char(wch: int | str) -> bool:
+    """Logical evaluation of whether the character can be typed into the name filter. (Key codes can not.)"""
+    return isinstance(wch, str) and (wch.isalpha() or wch in FILTER_CHARS)
 
 
-def search_by_words(term: str, text: str, split_char: str = SPACE_CHAR, case_sensitive: bool = False) -> bool:
-    if not case_sensitive:
-        term = term.casefold()
-        text = text.casefold()
-    term_set: set[str] = set(term.split(split_char))
-    hit: int = 0
-    for w in term_set:
-        if w.strip(whitespace) in text:
-            hit += 1
-    return len(term_set) == hit
+def fit_to_width(text: str, max_width: int, from_end: bool = False) -> str:
+    """Returns the longest beginning (or end) of the text that fits in max_width screen cells.
+    (Wide characters, e.g. CJK, take up two cells; a longer text would wrap onto the next line.)"""
+    if text.isascii():
+        return text[max(0, len(text) - max_width) :] if from_end else text[:max_width]
+    width: int = 0
+    for n, ch in enumerate(reversed(text) if from_end else text):
+        width += 2 if east_asian_width(ch) in ("W", "F") else 1
+        if width > max_width:
+            return text[len(text) - n :] if from_end else text[:n]
+    return text
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FdItem:
     """Dataclass storing the properties of a broadly interpreted file element."""
 
     is_dir: bool
     name: str  # File name and extension as well.
+    name_cf: str  # Casefolded name (for text filtering).
     full: str  # Full path (includes the file name as well).
-    size: int  # in bytes
-
-    def get_ext(self, with_dot: bool = False) -> str:
-        """Return extension."""
-        _, ext = os.path.splitext(self.name)
-        if with_dot:
-            return ext
-        return ext.lstrip(".")
+    ext: str  # Lowercase extension without the dot.
 
     def is_hidden(self) -> bool:
         """Logical evaluation of whether it is a dotfile."""
@@ -131,20 +119,26 @@ class Navi:
     def __init__(self, current_dir: str = ".") -> None:
         """Set current directory."""
         self.current_dir_list: list[str] = []
+        self.current_dir_cache: str = ""  # Empty if invalidated.
         self.fd_list: list[FdItem] = []
+        # Natural sort keys of the names in the listed directory, reused at its next refresh:
+        self.sort_keys: dict[str, tuple] = {}
+        self.sort_keys_dir: str = ""
 
         self.set_current_dir(current_dir)
 
     def discard_fd_list(self) -> None:
         """Deleting the contents of fd_list."""
-        self.fd_list *= 0
+        self.fd_list.clear()
 
     def refresh_fd_list(self) -> None:
         """Updating fd_list according to the current directory."""
         self.discard_fd_list()
 
+        current_dir: str = self.get_current_dir()
         try:
-            fd_temp: list[str] = natsorted(os.listdir(self.get_current_dir()))
+            with os.scandir(current_dir) as it:
+                entries: list[os.DirEntry] = list(it)
         except PermissionError:
             return
         except FileNotFoundError:
@@ -152,26 +146,38 @@ class Navi:
         except NotADirectoryError:
             return
 
-        for item in fd_temp:
-            if item in IGNORED_NAMES:
-                continue
-
-            full: str = os.path.join(self.get_current_dir(), item)
-            item_stat: os.stat_result = os.stat(full)
+        # Only the names of this listing are kept, so the memo never outgrows the directory (however big it is):
+        prev_keys: dict[str, tuple] = self.sort_keys if current_dir == self.sort_keys_dir else {}
+        sort_keys: dict[str, tuple] = {e.name: prev_keys.get(e.name) or NATSORT_KEY(e.name) for e in entries}
+        entries.sort(key=lambda e: sort_keys[e.name])
+        self.sort_keys, self.sort_keys_dir = sort_keys, current_dir
 
-            if not item_stat.st_size:
+        for entry in entries:
+            name_cf: str = entry.name.casefold()
+            if name_cf in IGNORED_NAMES_CF:
                 continue
 
-            self.fd_list.append(FdItem(is_dir=os.path.isdir(full), name=item, full=full, size=item_stat.st_size))
+            self.fd_list.append(
+                FdItem(
+                    is_dir=entry.is_dir(),
+                    name=entry.name,
+                    name_cf=name_cf,
+                    full=entry.path,
+                    ext=os.path.splitext(entry.name)[1][1:].lower(),
+                )
+            )
 
     def get_current_dir(self) -> str:
         """Retrieving the path of the current directory."""
-        return os.path.abspath(os.path.join(*self.current_dir_list))
+        if not self.current_dir_cache:
+            self.current_dir_cache = os.path.abspath(os.path.join(*self.current_dir_list))
+        return self.current_dir_cache
 
     def set_current_dir(self, current_dir: str) -> None:
         """Replaces the current directory value if the specified path points to a directory."""
         if os.path.isdir(current_dir):
             self.current_dir_list = [current_dir]
+            self.current_dir_cache = ""
 
     def cd(self, name: str) -> None:
         """Change directory."""
@@ -179,6 +185,7 @@ class Navi:
         if name == ".":
             return
         self.current_dir_list.append(name)
+        self.current_dir_cache = ""
 
     def up(self) -> None:
         """Navigating to the parent directory."""
@@ -190,14 +197,36 @@ class NaviFiltered(Navi):
         Navi.__init__(self, current_dir)
 
         self.fd_list_filtered: list[FdItem] = []
+        self.name_idx: dict[str, int] | None = None  # Name -> index in fd_list_filtered. (Built on demand.)
 
         self.filter_show_dirs: bool = True
         self.filter_show_hidden: bool = False
-        self.filter_exts: tuple[str, ...] = ()
+        self.filter_exts: frozenset[str] = frozenset()
         self.filter_text: str = ""
+        self.filter_words: tuple[str, ...] = ()  # Unique casefolded words of filter_text, longest first.
+
+        # Index sets over fd_list (rebuilt along with it), so that toggling a filter is just set arithmetic:
+        self.idx_dirs: frozenset[int] = frozenset()
+        self.idx_hidden: frozenset[int] = frozenset()
+        self.idx_exts: frozenset[int] = frozenset()  # Items allowed by filter_exts.
+
+    def refresh_fd_list(self) -> None:
+        Navi.refresh_fd_list(self)
+
+        self.idx_dirs = frozenset([i for i, item in enumerate(self.fd_list) if item.is_dir])
+        self.idx_hidden = frozenset([i for i, item in enumerate(self.fd_list) if item.is_hidden()])
+        self.refresh_idx_exts()
+
+    def refresh_idx_exts(self) -> None:
+        exts: frozenset[str] = self.filter_exts
+        if not exts:
+            self.idx_exts = frozenset(range(len(self.fd_list)))
+            return
+        self.idx_exts = frozenset([i for i, item in enumerate(self.fd_list) if item.is_dir or item.ext in exts])
 
     def discard_fd_list_filtered(self) -> None:
-        self.fd_list_filtered *= 0
+        self.fd_list_filtered.clear()
+        self.name_idx = None
 
     def toggle_filter_show_dirs(self) -> bool:
         self.filter_show_dirs = not self.filter_show_dirs
@@ -207,40 +236,67 @@ class NaviFiltered(Navi):
         self.filter_show_hidden = not self.filter_show_hidden
         return self.filter_show_hidden
 
-    def set_filter_exts(self, exts: tuple[str, ...]) -> None:
-        self.filter_exts = exts
+    def set_filter_exts(self, exts: Iterable[str]) -> None:
+        self.filter_exts = frozenset(exts)  # (No copy is made if it is already a frozenset.)
+        self.refresh_idx_exts()
 
-    def set_filter_text(self, text: str) -> None:
+    def set_filter_text(self, text: str) -> bool:
+        """Returns whether the filter words changed. (If not, e.g. after a space, no re-filtering is needed.)"""
+        prev_words: tuple[str, ...] = self.filter_words
         self.filter_text = text
+        self.filter_words = tuple(sorted(set(text.casefold().split()), key=len, reverse=True))
+        return self.filter_words != prev_words
 
     def get_filter_text(self) -> str:
         return self.filter_text
 
     def discard_filter_text(self) -> None:
-        self.filter_text *= 0
+        self.filter_text = ""
+        self.filter_words = ()
 
     def refresh_fd_list_filtered(self) -> None:
-        self.discard_fd_list_filtered()
+        visible: frozenset[int] = self.idx_exts
+        if not self.filter_show_dirs:
+            visible -= self.idx_dirs
+        if not self.filter_show_hidden:
+            visible -= self.idx_hidden
+
+        fd_list: list[FdItem] = self.fd_list
+        if len(visible) < len(fd_list):
+            fd_list = [fd_list[i] for i in sorted(visible)]
+
+        self.fd_list_filtered[:] = self.filter_by_text(fd_list)
+        self.name_idx = None
+
+    def narrow_fd_list_filtered(self) -> None:
+        """Re-filtering only fd_list_filtered by text, after the filter text has been extended.
+        (A longer filter text can only shrink the result, so the rest of fd_list need not be checked again.)"""
+        self.fd_list_filtered[:] = self.filter_by_text(self.fd_list_filtered)
+        self.name_idx = None
+
+    def filter_by_text(self, items: list[FdItem]) -> list[FdItem]:
+        """Returns the items whose name contains all the filter words.
+        One tight pass per word over the shrinking list (the longest, usually rarest word first),
+        instead of checking every word of every item one by one."""
+        for w in self.filter_words:
+            items = [item for item in items if w in item.name_cf]
+        return items
 
-        for item in self.fd_list:
-            if not self.filter_show_dirs and item.is_dir:
-                continue
-            if not self.filter_show_hidden and item.is_hidden():
-                continue
-            if self.filter_exts and not item.is_dir and item.get_ext() not in self.filter_exts:
-                continue
-            if self.filter_text and not search_by_words(self.filter_text, item.name):
-                continue
+    def get_index_by_name(self, name: str) -> int:
+        if self.name_idx is None:
+            self.name_idx = {item.name: i for i, item in enumerate(self.fd_list_filtered)}
+        return self.name_idx.get(name, -1)
 
-            self.fd_list_filtered.append(item)
 
-    def get_index_by_name(self, name: str) -> int:
-        i: int = -1
-        for c, item in enumerate(self.fd_list_filtered):
-            if name == item.name:
-                i = c
-                break
-        return i
+class DirtyFlags(IntFlag):
+    """Parts of the screen that have to be redrawn."""
+
+    NONE = 0
+    STATUS = 1
+    LIST = 2
+    MESSAGE = 4
+    FILTER = 8
+    ALL = STATUS | LIST | MESSAGE | FILTER
 
 
 class App:
@@ -277,15 +333,35 @@ class App:
             curses.init_pair(6, 6, -1)  # fg: cyan
             curses.init_pair(7, 1, -1)  # fg: red
 
+        # Looked up once, instead of for every row of every draw:
+        self.style_default: int = curses.color_pair(1)
+        self.style_dir: int = curses.color_pair(4)
+        self.style_last_item: int = curses.color_pair(6)
+        self.ext_styles: dict[str, int] = {
+            **dict.fromkeys(VIDEO_EXTS, curses.color_pair(2)),
+            **dict.fromkeys(AUDIO_EXTS, curses.color_pair(3)),
+            **dict.fromkeys(SUB_EXTS, curses.color_pair(5)),
+            **dict.fromkeys(OTHER_EXTS, curses.color_pair(7)),
+        }
+
         self.refresh_sizes()
 
+        # What was drawn last time:
+        self.prev_rows: list[tuple[str, int]] = []  # (text, style) of the list rows.
+        self.prev_status: str = ""
+        self.prev_message_line: str = ""
+        self.prev_filter_line: str = ""
+        self.dirty: DirtyFlags = DirtyFlags.ALL  # Collected by input (and reap_children), cleared by draw.
+
         self.cursor: int = 0
         self.offset: int = 0
 
         self.last_item_file: str = last_item_file
+        self.last_item_fd: int = -1  # Opened at the first save, then kept open until exit.
         self.last_item: str = ""
         try:
-            self.last_item = Path(self.last_item_file).read_text(encoding="utf-8").strip()
+            with open(self.last_item_file, encoding="utf-8") as f:
+                self.last_item = f.readline().strip()  # Only the first line is used.
         except FileNotFoundError:
             pass
 
@@ -296,7 +372,8 @@ class App:
             self.navi_filtered.refresh_fd_list_filtered()
 
         self.current_message: str = ""
-        self.pids: list[int] = []
+        self.procs: dict[int, Popen] = {}  # PID -> running mpv, in launch order.
+        self.closing: list[Popen] = []  # Terminated, but not reaped yet. (Not counted as running.)
         self.sub_path: str = ""
 
     def restore_last_item(self) -> bool:
@@ -309,11 +386,19 @@ class App:
         return False
 
     def save_last_item(self) -> None:
-        Path(self.last_item_file).write_text(self.last_item, encoding="utf-8")
+        # Rewriting through the kept-open descriptor: no open/close per save,
+        # and the file is never left empty (write first, then cut off the old tail).
+        if self.last_item_fd < 0:
+            self.last_item_fd = os.open(self.last_item_file, os.O_WRONLY | os.O_CREAT, 0o666)
+        data: bytes = self.last_item.encode("utf-8")
+        os.pwrite(self.last_item_fd, data, 0)
+        os.ftruncate(self.last_item_fd, len(data))
 
     def refresh_sizes(self) -> None:
         curses.update_lines_cols()
-        self.avail_lines: int = curses.LINES - self.UNUSED_LINES
+        self.lines: int = curses.LINES
+        self.cols: int = curses.COLS
+        self.avail_lines: int = self.lines - self.UNUSED_LINES
         self.avail_lines_i: int = self.avail_lines - 1
 
     def reset_index(self) -> None:
@@ -325,71 +410,107 @@ class App:
     def get_cursor_item(self) -> FdItem:
         return self.navi_filtered.fd_list_filtered[self.get_index()]
 
-    def draw(self) -> None:
+    def clear_screen(self) -> None:
+        """Erases the window and forgets the rows drawn previously, so the next draw repaints everything."""
         self.window.erase()
+        self.prev_rows.clear()
+        self.prev_status = ""
+        self.prev_message_line = ""
+        self.prev_filter_line = ""
+        self.dirty = DirtyFlags.ALL
 
-        # Status line:
-        status_line: list[str] = [self.navi_filtered.get_current_dir()]
-        if not self.navi_filtered.fd_list_filtered:
-            status_line.append("[EMPTY]")
-        if self.sub_path:
-            status_line.append("[SUB]")
-        pids_num: int = len(self.pids)
-        if pids_num:
-            status_line.append(f"[mpv:{pids_num}]")
-        if not self.navi_filtered.filter_show_dirs:
-            status_line.append("(NO DIR.)")
-        if self.navi_filtered.filter_show_hidden:
-            status_line.append("(HIDDEN)")
-        self.window.addstr(0, 0, str(fixed_len_slice((2 * SPACE_CHAR).join(status_line), curses.COLS, 1000)))
+    def draw(self) -> None:
+        """Only the parts marked in self.dirty are rebuilt, and only the lines (and list rows)
+        that differ from the previous draw are rewritten, so no full erase() is needed."""
+
+        dirty: DirtyFlags = self.dirty
+        self.dirty = DirtyFlags.NONE
+        lines: int = self.lines
+        cols: int = self.cols
+
+        # Status line: (only rebuilt if something may have changed it, and only rewritten if it did)
+        if dirty & DirtyFlags.STATUS:
+            status_line: list[str] = [self.navi_filtered.get_current_dir()]
+            if not self.navi_filtered.fd_list_filtered:
+                status_line.append("[EMPTY]")
+            if self.sub_path:
+                status_line.append("[SUB]")
+            procs_num: int = len(self.procs)
+            if procs_num:
+                status_line.append(f"[mpv:{procs_num}]")
+            if not self.navi_filtered.filter_show_dirs:
+                status_line.append("(NO DIR.)")
+            if self.navi_filtered.filter_show_hidden:
+                status_line.append("(HIDDEN)")
+            status: str = fit_to_width((2 * SPACE_CHAR).join(status_line), cols, from_end=True)
+            if status != self.prev_status:
+                self.prev_status = status
+                self.window.move(0, 0)
+                self.window.clrtoeol()
+                self.window.addstr(0, 0, status)
 
         # List:
-        line_num: int = self.LIST_START
-        for i, item in enumerate(fixed_len_slice(self.navi_filtered.fd_list_filtered, self.avail_lines, self.offset)):
-            name: str = item.name
-            ext: str = item.get_ext()
-            style: int = curses.color_pair(1)
-
-            if item.is_dir:
-                name = "".join((name, "/"))
-                style = curses.color_pair(4)
-            elif item.full == self.last_item:
-                style = curses.color_pair(6)
-            elif ext in VIDEO_EXTS:
-                style = curses.color_pair(2)
-            elif ext in AUDIO_EXTS:
-                style = curses.color_pair(3)
-            elif ext in SUB_EXTS:
-                style = curses.color_pair(5)
-            elif ext in OTHER_EXTS:
-                style = curses.color_pair(7)
-            else:
-                pass
+        if dirty & DirtyFlags.LIST:
+            rows: list[tuple[str, int]] = []
+            fd_list_filtered: list[FdItem] = self.navi_filtered.fd_list_filtered
+            start: int = max(0, min(self.offset, len(fd_list_filtered) - self.avail_lines))
+            for i, item in enumerate(islice(fd_list_filtered, start, start + self.avail_lines)):
+                name: str = item.name
+                style: int
+
+                if item.is_dir:
+                    name = "".join((name, "/"))
+                    style = self.style_dir
+                elif item.full == self.last_item:
+                    style = self.style_last_item
+                else:
+                    style = self.ext_styles.get(item.ext, self.style_default)
+
+                if i == self.cursor:
+                    style = style | curses.A_REVERSE
 
-            if i == self.cursor:
-                style = style | curses.A_REVERSE
+                rows.append((fit_to_width(name, cols), style))
 
-            self.window.addstr(line_num, 0, str(fixed_len_slice(name, curses.COLS)), style)
+            rows.extend(("", 0) for _ in range(self.avail_lines - len(rows)))
 
-            line_num += 1
+            for i, row in enumerate(rows):
+                if i < len(self.prev_rows) and self.prev_rows[i] == row:
+                    continue
+                line_num: int = self.LIST_START + i
+                self.window.move(line_num, 0)
+                self.window.clrtoeol()
+                if row[0]:
+                    self.window.addstr(line_num, 0, row[0], row[1])
+
+            self.prev_rows = rows
 
         # Message line:
-        if self.current_message:
-            self.window.addstr(
-                curses.LINES - 2, 0, str(fixed_len_slice(SPACE_CHAR.join(("[LM]", self.current_message)), curses.COLS))
-            )
+        if dirty & DirtyFlags.MESSAGE:
+            message_line: str = ""
+            if self.current_message:
+                message_line = fit_to_width(SPACE_CHAR.join(("[LM]", self.current_message)), cols)
+            if message_line != self.prev_message_line:
+                self.prev_message_line = message_line
+                self.window.move(lines - 2, 0)
+                self.window.clrtoeol()
+                if message_line:
+                    self.window.addstr(lines - 2, 0, message_line)
 
         # Name filter input:
-        try:
-            self.window.addstr(
-                curses.LINES - 1,
-                0,
-                str(fixed_len_slice("".join((":", self.navi_filtered.get_filter_text())), curses.COLS, 1000)),
-            )
-        except curses.error:
-            pass
-
-        self.window.refresh()
+        if dirty & DirtyFlags.FILTER:
+            filter_line: str = fit_to_width("".join((":", self.navi_filtered.get_filter_text())), cols, from_end=True)
+            if filter_line != self.prev_filter_line:
+                self.prev_filter_line = filter_line
+                self.window.move(lines - 1, 0)
+                self.window.clrtoeol()
+                try:
+                    self.window.addstr(lines - 1, 0, filter_line)
+                except curses.error:
+                    pass
+
+        # Only the changed cells are sent to the terminal, in one go:
+        self.window.noutrefresh()
+        curses.doupdate()
 
     def choose(self, with_save: bool = False, mpv_paused: bool = False) -> None:
         try:
@@ -403,21 +524,35 @@ class App:
             self.navi_filtered.refresh_fd_list()
             self.navi_filtered.refresh_fd_list_filtered()
             self.reset_index()
+            self.dirty |= DirtyFlags.STATUS | DirtyFlags.LIST | DirtyFlags.FILTER
         else:
-            ext: str = item.get_ext()
+            self.dirty |= DirtyFlags.STATUS | DirtyFlags.LIST | DirtyFlags.MESSAGE
+            ext: str = item.ext
             if ext in SUB_EXTS:
                 if self.sub_path != item.full:
                     self.sub_path = item.full
                     self.current_message = f"Subtitle selected: {item.name}"
                 else:
-                    self.sub_path *= 0
+                    self.sub_path = ""
                     self.current_message = "No subtitle selected."
                 return
 
+            # The size is only needed here, so it is not queried for every entry of the listing.
+            try:
+                size: int = os.stat(item.full).st_size
+            except OSError:  # e.g. a broken symlink
+                self.current_message = f"Cannot be opened: {item.name}"
+                return
+            if not size:
+                self.current_message = f"Empty file: {item.name}"
+                return
+
+            proc: Popen
             if ext == "iso":  # Requires a different command.
-                self.pids.append(mpv_open_iso(item.full, item.size, mpv_paused))
+                proc = mpv_open_iso(item.full, size, mpv_paused)
             else:
-                self.pids.append(mpv_open(item.full, self.sub_path, mpv_paused))
+                proc = mpv_open(item.full, self.sub_path, mpv_paused)
+            self.procs[proc.pid] = proc
 
             if with_save:
                 self.last_item = item.full
@@ -471,11 +606,14 @@ class App:
         wch = self.window.get_wch()
         if wch == curses.KEY_RESIZE:
             self.refresh_sizes()
+            self.clear_screen()
             self.set_cursor(self.get_index())
         elif wch == curses.KEY_DOWN:
             self.input_down()
+            self.dirty |= DirtyFlags.LIST
         elif wch == curses.KEY_UP:
             self.input_up()
+            self.dirty |= DirtyFlags.LIST
         elif wch == curses.KEY_LEFT:
             prev_dirname = os.path.basename(self.navi_filtered.get_current_dir())
             self.navi_filtered.up()
@@ -484,76 +622,125 @@ class App:
             self.navi_filtered.refresh_fd_list()
             self.navi_filtered.refresh_fd_list_filtered()
             self.set_cursor(self.navi_filtered.get_index_by_name(prev_dirname))
+            self.dirty |= DirtyFlags.STATUS | DirtyFlags.LIST | DirtyFlags.FILTER
         elif wch == curses.KEY_RIGHT:
             self.choose()
         elif wch in (curses.KEY_ENTER, "\n"):
             self.choose(with_save=True, mpv_paused=True)
         elif wch in (curses.KEY_HOME, curses.KEY_PPAGE):
             self.reset_index()
+            self.dirty |= DirtyFlags.LIST
         elif wch in (curses.KEY_END, curses.KEY_NPAGE):
             self.set_cursor(len(self.navi_filtered.fd_list_filtered) - 1)
+            self.dirty |= DirtyFlags.LIST
         elif wch == curses.KEY_F5:
-            self.check_pids()
-            self.current_message *= 0
+            self.reap_children()
+            self.current_message = ""
             self.navi_filtered.refresh_fd_list()
             self.navi_filtered.refresh_fd_list_filtered()
             self.reset_index()
+            self.dirty |= DirtyFlags.ALL
         elif wch == curses.KEY_F6:
             self.navi_filtered.toggle_filter_show_dirs()
-            self.navi_filtered.refresh_fd_list_filtered()
-            self.reset_index()
+            if self.navi_filtered.idx_dirs:  # Without directories the list stays the same.
+                self.navi_filtered.refresh_fd_list_filtered()
+                self.reset_index()
+            self.dirty |= DirtyFlags.STATUS | DirtyFlags.LIST
         elif wch == curses.KEY_F7:
             self.navi_filtered.toggle_filter_show_hidden()
-            self.navi_filtered.refresh_fd_list_filtered()
-            self.reset_index()
+            if self.navi_filtered.idx_hidden:  # Without dotfiles the list stays the same.
+                self.navi_filtered.refresh_fd_list_filtered()
+                self.reset_index()
+            self.dirty |= DirtyFlags.STATUS | DirtyFlags.LIST
         elif wch == curses.KEY_F8:
             self.restore_last_item()
+            self.dirty |= DirtyFlags.STATUS | DirtyFlags.LIST
         elif wch == curses.KEY_F9:
-            self.pids.append(mpv_open(self.navi_filtered.get_current_dir()))
+            proc = mpv_open(self.navi_filtered.get_current_dir())
+            self.procs[proc.pid] = proc
             self.current_message = "Entire directory selected for playback. (after F9)"
+            self.dirty |= DirtyFlags.STATUS | DirtyFlags.MESSAGE
         elif wch == curses.KEY_F10:
-            self.sub_path *= 0
+            self.sub_path = ""
             self.current_message = "No subtitle selected. (after F10)"
+            self.dirty |= DirtyFlags.STATUS | DirtyFlags.MESSAGE
         elif wch == curses.KEY_F11:
             self.close_last_mpv()
+            self.dirty |= DirtyFlags.STATUS | DirtyFlags.MESSAGE
         elif wch == curses.KEY_F12:  # exit
             return True
         elif wch == curses.KEY_BACKSPACE:
-            self.navi_filtered.set_filter_text(self.navi_filtered.get_filter_text()[:-1])
-            self.navi_filtered.refresh_fd_list_filtered()
+            if self.navi_filtered.set_filter_text(self.navi_filtered.get_filter_text()[:-1]):
+                self.navi_filtered.refresh_fd_list_filtered()
+            self.dirty |= DirtyFlags.STATUS | DirtyFlags.LIST | DirtyFlags.FILTER
         elif wch in (curses.KEY_DC, curses.KEY_DL):
+            filtered: bool = bool(self.navi_filtered.filter_words)  # Not just spaces (or nothing).
             self.navi_filtered.discard_filter_text()
-            self.navi_filtered.refresh_fd_list_filtered()
-        else:
-            wch_str = str(wch)
-
-            if wch_str.isalpha() or wch_str == SPACE_CHAR or wch_str in tuple(digits) or wch_str in tuple(punctuation):
-                self.navi_filtered.set_filter_text("".join((self.navi_filtered.get_filter_text(), wch_str)))
+            if filtered:
                 self.navi_filtered.refresh_fd_list_filtered()
+            self.dirty |= DirtyFlags.STATUS | DirtyFlags.LIST | DirtyFlags.FILTER
+        elif is_filter_char(wch):
+            if self.navi_filtered.set_filter_text(
+                "".join((self.navi_filtered.get_filter_text(), wch, self.read_pending_filter_chars()))
+            ):
+                self.navi_filtered.narrow_fd_list_filtered()
                 self.reset_index()
+                self.dirty |= DirtyFlags.STATUS | DirtyFlags.LIST
+            self.dirty |= DirtyFlags.FILTER
 
         return False
 
-    def check_pids(self) -> None:
-        self.pids = list(filter(process_exists, self.pids))
+    def read_pending_filter_chars(self) -> str:
+        """Reads the filter characters that are already waiting (typed quickly or pasted),
+        so that they are filtered and drawn only once. The first other key is put back."""
+        chars: list[str] = []
+        self.window.nodelay(True)
+        try:
+            while 1:
+                try:
+                    wch = self.window.get_wch()
+                except curses.error:  # No more pending input.
+                    break
+                if is_filter_char(wch):
+                    chars.append(wch)
+                    continue
+                if isinstance(wch, int):  # Key codes can only be pushed back by ungetch.
+                    curses.ungetch(wch)
+                else:
+                    curses.unget_wch(wch)
+                break
+        finally:
+            self.window.nodelay(False)
+        return "".join(chars)
+
+    def reap_children(self) -> None:
+        """Collecting the finished mpv processes (so they do not remain zombies) and forgetting them."""
+        finished: list[int] = [pid for pid, proc in self.procs.items() if proc.poll() is not None]
+        for pid in finished:
+            del self.procs[pid]
+        if finished:
+            self.dirty |= DirtyFlags.STATUS
+        if self.closing:
+            self.closing = [proc for proc in self.closing if proc.poll() is None]
 
     def close_last_mpv(self) -> None:
-        self.check_pids()
-        if not self.pids:
+        self.reap_children()
+        if not self.procs:
             self.current_message = "mpv instance is not running."
             return
 
-        last_pid: int = self.pids.pop()
+        last_pid, last_proc = self.procs.popitem()  # The most recently launched one.
+        if last_proc.poll() is not None:  # It has exited since the reaping above.
+            self.current_message = f"mpv has already exited. (PID: {last_pid})"
+            return
 
-        try:
-            os.kill(last_pid, SIGTERM)
-        except ProcessLookupError:
-            pass
-        else:
-            self.current_message = f"mpv closed. (PID: {last_pid})"
+        last_proc.terminate()
+        self.closing.append(last_proc)  # Reaped by reap_children once it has exited.
+        self.current_message = f"mpv closed. (PID: {last_pid})"
 
     def loop(self) -> None:
         while 1:
+            self.reap_children()
             self.draw()
             if self.input():
                 break
@@ -565,6 +752,8 @@ class App:
             pass
         finally:
             curses.endwin()
+            if self.last_item_fd >= 0:
+                os.close(self.last_item_fd)
 
 
 # Basic variables: